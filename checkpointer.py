@@ -0,0 +1,74 @@
+from collections import OrderedDict
+from typing import Any, Dict, Set, Tuple
+from langgraph.checkpoint.memory import InMemorySaver
+import logging
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+class BoundedInMemorySaver(InMemorySaver):
+    """InMemorySaver that keeps only the latest checkpoints of the most recently used threads"""
+
+    def __init__(self, max_threads: int = 1000, max_checkpoints: int = 2):
+        super().__init__()
+        self.max_threads = max_threads
+        self.max_checkpoints = max_checkpoints
+        # thread_id -> None, ordered from least to most recently written
+        self._threads: "OrderedDict[str, None]" = OrderedDict()
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        """Save a checkpoint, then drop superseded checkpoints and idle threads"""
+        saved_config = super().put(config, checkpoint, metadata, new_versions)
+
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        self._prune_checkpoints(thread_id, checkpoint_ns)
+
+        self._threads[thread_id] = None
+        self._threads.move_to_end(thread_id)
+        while len(self._threads) > self.max_threads:
+            evicted, _ = self._threads.popitem(last=False)
+            self._evict_thread(evicted)
+
+        return saved_config
+
+    def _prune_checkpoints(self, thread_id: str, checkpoint_ns: str) -> None:
+        """Keep only the newest max_checkpoints checkpoints of a thread namespace"""
+        checkpoints = self.storage[thread_id][checkpoint_ns]
+        if len(checkpoints) <= self.max_checkpoints:
+            return
+
+        # Checkpoint ids are time-ordered, so sorting puts the newest last
+        checkpoint_ids = sorted(checkpoints)
+        stale_ids = checkpoint_ids[:-self.max_checkpoints]
+        stale = {checkpoint_id: checkpoints.pop(checkpoint_id) for checkpoint_id in stale_ids}
+        for checkpoint_id in stale_ids:
+            self.writes.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+
+        # Newer langgraph-checkpoint releases store channel values as separate blobs
+        blobs = getattr(self, "blobs", None)
+        if blobs is None:
+            return
+
+        live_versions = self._channel_versions(checkpoints.values())
+        for channel, version in self._channel_versions(stale.values()) - live_versions:
+            blobs.pop((thread_id, checkpoint_ns, channel, version), None)
+
+    def _channel_versions(self, saved_checkpoints) -> Set[Tuple[str, Any]]:
+        """Collect the (channel, version) pairs referenced by stored checkpoints"""
+        versions: Set[Tuple[str, Any]] = set()
+        for serialized_checkpoint, _, _ in saved_checkpoints:
+            checkpoint: Dict[str, Any] = self.serde.loads_typed(serialized_checkpoint)
+            versions.update(checkpoint.get("channel_versions", {}).items())
+        return versions
+
+    def _evict_thread(self, thread_id: str) -> None:
+        """Drop every checkpoint, write and blob stored for a thread"""
+        logger.debug("Evicting checkpoints for idle thread %s", thread_id)
+        self.storage.pop(thread_id, None)
+        for key in [key for key in self.writes if key[0] == thread_id]:
+            del self.writes[key]
+        blobs = getattr(self, "blobs", None)
+        if blobs is not None:
+            for key in [key for key in blobs if key[0] == thread_id]:
+                del blobs[key]
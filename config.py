@@ -8,11 +8,50 @@ class Config:
     # OpenAI Configuration
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
     OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-5-mini")
+    SUMMARY_MODEL = os.getenv("SUMMARY_MODEL", "gpt-4o-mini")
+    
+    # HTTP Connection Pool Configuration (shared by every PositioningWorkflow)
+    HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", 100))
+    HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", 50))
+    
+    # Prompt Cache Configuration
+    PROMPT_CACHE_SIZE = int(os.getenv("PROMPT_CACHE_SIZE", 10000))
+    # Semantic (embedding) tier is opt-in: a near-duplicate hit reuses another session's answer
+    SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE_ENABLED", "False").lower() == "true"
+    SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", 0.95))
+    EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
+    # Whole plans / research reports, keyed by the Step 1 responses
+    RESULT_CACHE_SIZE = int(os.getenv("RESULT_CACHE_SIZE", 1024))
+    RESULT_CACHE_TTL_SECONDS = int(os.getenv("RESULT_CACHE_TTL_SECONDS", 3600))
+    
+    # Concurrency Configuration
+    OPENAI_REQUESTS_PER_MINUTE = int(os.getenv("OPENAI_REQUESTS_PER_MINUTE", 500))
+    OPENAI_TOKENS_PER_MINUTE = int(os.getenv("OPENAI_TOKENS_PER_MINUTE", 200000))
+    MAX_CONCURRENT_VALIDATIONS = int(os.getenv("MAX_CONCURRENT_VALIDATIONS", 20))
+    MAX_CONCURRENT_RESEARCH_CALLS = int(os.getenv("MAX_CONCURRENT_RESEARCH_CALLS", 8))
+    THREADPOOL_TOKENS = int(os.getenv("THREADPOOL_TOKENS", 100))
+    # Seconds startup waits for the tiktoken encoding before serving with estimated counts
+    TOKENIZER_WARMUP_TIMEOUT = float(os.getenv("TOKENIZER_WARMUP_TIMEOUT", 10))
+    
+    # Session State Configuration
+    MAX_SESSION_MESSAGES = int(os.getenv("MAX_SESSION_MESSAGES", 10))
+    MAX_CHECKPOINT_SESSIONS = int(os.getenv("MAX_CHECKPOINT_SESSIONS", 1000))
+    MAX_HISTORY_TOKENS = int(os.getenv("MAX_HISTORY_TOKENS", 4000))
     
     # Server Configuration
     HOST = os.getenv("HOST", "0.0.0.0")
     PORT = int(os.getenv("PORT", 8000))
     
+    # Session Storage Configuration
+    REDIS_URL = os.getenv("REDIS_URL")
+    SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", 24 * 60 * 60))
+    MAX_IN_MEMORY_SESSIONS = int(os.getenv("MAX_IN_MEMORY_SESSIONS", 10000))
+    
+    # Worker processes. REDIS_URL shares session state across workers, but each
+    # worker keeps its own chat history (the LangGraph checkpointer is in process),
+    # so only raise this behind a load balancer with sticky sessions
+    WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", 1))
+    
     # Application Configuration
     DEBUG = os.getenv("DEBUG", "False").lower() == "true"
     
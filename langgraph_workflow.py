@@ -1,37 +1,479 @@
-from typing import Dict, List, Any, Optional
-from langchain_core.messages import HumanMessage, AIMessage, BaseMessage
-from langchain_openai import ChatOpenAI
+from typing import Annotated, AsyncIterator, Dict, Final, List, Any, Literal, Optional, Tuple
+from langchain_core.messages import HumanMessage, AIMessage, BaseMessage, RemoveMessage, SystemMessage
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from openai import AsyncOpenAI
 from langgraph.graph import StateGraph, START, END
-from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph.message import add_messages
 from pydantic import BaseModel
+from dataclasses import dataclass
+from functools import lru_cache
+from cachetools import LRUCache, TTLCache
 import os
+import re
+import json
+import orjson
+import hashlib
+import asyncio
+import httpx
+import string
+import textwrap
 import logging
 from config import Config
+from llm_cache import CachedChatModel, SemanticIndex
+from checkpointer import BoundedInMemorySaver
+from rate_limiter import RateLimiter, RateLimitedChatModel
+from token_counter import count_tokens
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-class WorkflowState(BaseModel):
-    messages: List[BaseMessage]
+# Step-specific system context, dedented once at import time
+_STEP_CONTEXT_SOURCES = {
+    1: """
+    You are helping with Step 1: Context Gathering & Planning.
+    
+    The user is answering questions about:
+    - Company name
+    - Company description  
+    - Customer description
+    - Positioning experience (first time vs repositioning)
+    - Company scope (whole company vs specific segment)
+    
+    Be conversational and encouraging. Ask follow-up questions if responses are unclear.
+    """,
+    2: """
+    You are helping with Step 2: Customer Understanding & Persona Development.
+    
+    The user has been asked to upload persona documents or indicate they don't have them.
+    If they mention uploading documents, acknowledge it and proceed with automated research.
+    If they say they don't have personas, provide the research todo list and ask if they want automated research.
+    If they want automated research, conduct competitor research to identify ICP, buyers, influencers, and users.
+    
+    Focus on understanding the target customers in detail through:
+    - Document analysis (if uploaded)
+    - Automated competitor research
+    - Customer persona development
+    - ICP identification
+    """,
+    3: """
+    You are helping with Step 3: Stakeholder & Customer Interviews.
+    
+    Focus on gathering insights from stakeholders and customers. Ask about:
+    - Key stakeholders
+    - Interview insights
+    - Customer feedback
+    - Market research
+    """,
+    4: """
+    You are helping with Step 4: Category & Competitive Positioning.
+    
+    Focus on competitive landscape and market positioning. Ask about:
+    - Competitors
+    - Market category
+    - Differentiation
+    - Competitive advantages
+    """,
+    5: """
+    You are helping with Step 5: Feature/Benefit Translation ("Product Legos").
+    
+    Focus on translating features into benefits. Ask about:
+    - Key features
+    - Customer benefits
+    - Value propositions
+    - Product capabilities
+    """,
+    6: """
+    You are helping with Step 6: Positioning Statement Creation.
+    
+    Focus on creating clear positioning statements. Ask about:
+    - Target audience
+    - Market category
+    - Key benefit
+    - Proof points
+    """,
+    7: """
+    You are helping with Step 7: Positioning Workshop Facilitation.
+    
+    Focus on facilitating positioning workshops. Ask about:
+    - Workshop participants
+    - Key insights
+    - Decisions made
+    - Next steps
+    """,
+    8: """
+    You are helping with Step 8: Messaging Framework & Brand Essence.
+    
+    Focus on developing messaging frameworks. Ask about:
+    - Brand essence
+    - Key messages
+    - Tone and voice
+    - Messaging hierarchy
+    """,
+    9: """
+    You are helping with Step 9: Proof Points & Narrative.
+    
+    Focus on developing proof points and narratives. Ask about:
+    - Supporting evidence
+    - Customer stories
+    - Case studies
+    - Success metrics
+    """,
+    10: """
+    You are helping with Step 10: Asset Generation & Application.
+    
+    Focus on creating marketing assets. Ask about:
+    - Asset types needed
+    - Content requirements
+    - Distribution channels
+    - Asset specifications
+    """,
+    11: """
+    You are helping with Step 11: Asset Inventory & Message Testing.
+    
+    Focus on testing and optimizing messages. Ask about:
+    - Testing methods
+    - Performance metrics
+    - Optimization opportunities
+    - Final recommendations
+    """
+}
+
+_STEP_CONTEXTS: Final[Dict[int, str]] = {
+    step: textwrap.dedent(context) for step, context in _STEP_CONTEXT_SOURCES.items()
+}
+
+_DEFAULT_STEP_CONTEXT: Final[str] = "You are helping with positioning and messaging."
+
+# Instructions for the combined analyze + reply turn
+_TURN_INSTRUCTIONS: Final[str] = textwrap.dedent("""
+    For each user message, first analyze it for clarity and completeness.
+    
+    Set status to 'NEEDS_FOLLOWUP' if the message is unclear, too brief, or needs clarification.
+    In that case, reply with 1-2 specific follow-up questions to get clearer, more detailed information.
+    Ask for specific details, examples, or clarification.
+    
+    Set status to 'COMPLETE' if the message is clear and sufficient.
+    In that case, reply with a helpful, conversational response. If this is a response to a specific question, acknowledge it and ask the next question if appropriate.
+    
+    Be conversational and helpful in either case.
+    """)
+
+# Fully static system prompt per step, so OpenAI's prompt cache can reuse the prefix
+_TURN_SYSTEM_PROMPTS: Final[Dict[int, str]] = {
+    step: f"{context}{_TURN_INSTRUCTIONS}" for step, context in _STEP_CONTEXTS.items()
+}
+
+_DEFAULT_TURN_SYSTEM_PROMPT: Final[str] = f"{_DEFAULT_STEP_CONTEXT}\n{_TURN_INSTRUCTIONS}"
+
+# The 11 workflow steps, shared by the plan prompt and the fallback plan
+_PMM_STEPS: Final[Tuple[str, ...]] = (
+    "Context Gathering & Planning",
+    "Customer Understanding & Persona Development",
+    "Stakeholder & Customer Interviews",
+    "Category & Competitive Positioning",
+    "Feature/Benefit Translation (\"Product Legos\")",
+    "Positioning Statement Creation",
+    "Positioning Workshop Facilitation",
+    "Messaging Framework & Brand Essence",
+    "Proof Points & Narrative",
+    "Asset Generation & Application",
+    "Asset Inventory & Message Testing",
+)
+
+# What the fallback plan promises for steps 2-11
+_PMM_FALLBACK_STEP_DESCRIPTIONS: Final[Tuple[str, ...]] = (
+    "We'll dive deep into understanding your $customer_description to create detailed customer personas.",
+    "We'll gather insights from key stakeholders and customers to inform your positioning.",
+    "We'll analyze your competitive landscape and define your market category.",
+    "We'll translate your $company_description features into compelling customer benefits.",
+    "We'll craft clear, compelling positioning statements for **$company_name**.",
+    "We'll facilitate workshops to refine and validate your positioning.",
+    "We'll develop your core messaging framework and brand essence.",
+    "We'll create supporting evidence and compelling narratives.",
+    "We'll develop marketing assets and content.",
+    "We'll test and optimize your messaging for maximum impact.",
+)
+
+_PMM_STEP_LIST: Final[str] = "\n".join(
+    f"        {number}. {name}" for number, name in enumerate(_PMM_STEPS, start=1)
+)
+
+_PMM_FALLBACK_STEP_BLOCK: Final[str] = "\n\n".join(
+    f"**Step {number}: {name}** - {description}"
+    for number, (name, description) in enumerate(zip(_PMM_STEPS[1:], _PMM_FALLBACK_STEP_DESCRIPTIONS), start=2)
+)
+
+# PMM plan prompt; only the Step 1 answers vary between calls
+_PMM_PROMPT_TEMPLATE: Final[string.Template] = string.Template("""
+        Based on the following information about $company_name, generate a personalized PMM (Positioning & Messaging) plan that outlines how we'll help them through our 11-step workflow.
+        
+        
+        Company Information:
+        - Company Name: $company_name
+        - Business Description: $company_description
+        - Customer Description: $customer_description
+        - Positioning Experience: $positioning_experience
+        - Company Scope: $company_scope$product_line
+        
+        Create a brief, personalized plan that mentions all 11 steps of our PMM workflow:
+""" + _PMM_STEP_LIST + """
+        
+        Make it conversational and specific to their business. Explain how each step will help them achieve their positioning and messaging goals.
+        """)
+
+# Canned plan returned when the LLM call fails
+_PMM_FALLBACK_TEMPLATE: Final[string.Template] = string.Template(f"""🎉 **Great! You've completed Step 1: {_PMM_STEPS[0]}**
+
+Based on your responses about **$company_name**, here's how I'll help you through our comprehensive PMM workflow:
+
+**Your Personalized PMM Journey:**
+
+{_PMM_FALLBACK_STEP_BLOCK}
+
+Since you're doing this $positioning_experience for $scope_text, we'll tailor each step to your specific needs and goals.""")
+
+# Research report sections and the insights each one covers
+_RESEARCH_SECTIONS: Final[Tuple[Tuple[str, Tuple[str, ...]], ...]] = (
+    ("Ideal Customer Profile (ICP)", (
+        "Demographics and firmographics",
+        "Industry verticals and company sizes",
+        "Technology stack and preferences",
+        "Pain points and challenges",
+    )),
+    ("Buyer Personas", (
+        "Decision makers vs end users",
+        "Roles and responsibilities",
+        "Buying journey stages",
+        "Decision criteria and influence factors",
+    )),
+    ("Key Influencers", (
+        "Industry thought leaders",
+        "Internal champions",
+        "Community advocates",
+        "Media and analyst relationships",
+    )),
+    ("User Personas", (
+        "End-user characteristics",
+        "Usage patterns and behaviors",
+        "Feature preferences",
+        "Success metrics",
+    )),
+)
+
+def _format_research_section(number: int, title: str, insights: Tuple[str, ...]) -> str:
+    """Render one research section as a numbered heading with its insight bullets"""
+    bullets = "\n".join(f"           - {insight}" for insight in insights)
+    return f"        {number}. **{title}**:\n{bullets}"
+
+_RESEARCH_PROMPT_HEADER: Final[str] = """
+        You are a market research analyst conducting automated competitor research. Based on the following company information, research and identify their ICP, buyers, influencers, and users by analyzing competitor websites and market data.
+
+        Company: $company_name
+        Business: $company_description
+        Current Customers: $customer_description
+"""
+
+# Full competitor research prompt, used by the streaming and batch entry points
+_RESEARCH_PROMPT_TEMPLATE: Final[string.Template] = string.Template(_RESEARCH_PROMPT_HEADER + """
+        Conduct comprehensive research and provide detailed insights on:
+
+""" + "\n\n".join(
+    _format_research_section(number, title, insights)
+    for number, (title, insights) in enumerate(_RESEARCH_SECTIONS, start=1)
+) + """
+
+        Format your response as a comprehensive research report with clear sections and actionable insights.
+        """)
+
+# One prompt per section, so the sections can be researched concurrently
+_RESEARCH_SECTION_TEMPLATES: Final[Tuple[string.Template, ...]] = tuple(
+    string.Template(_RESEARCH_PROMPT_HEADER + f"""
+        Conduct focused research and provide detailed insights on:
+
+{_format_research_section(number, title, insights)}
+
+        Format your response as the "{number}. {title}" section of a research report, starting with that heading, with actionable insights.
+        """)
+    for number, (title, insights) in enumerate(_RESEARCH_SECTIONS, start=1)
+)
+
+@dataclass
+class WorkflowState:
+    # Plain dataclass: the state is built internally, so skip Pydantic validation
+    # of the BaseMessage list on every turn.
+    # Conversation history accumulates per thread; turns beyond max_messages
+    # are folded into summary
+    messages: Annotated[List[BaseMessage], add_messages]
     current_step: int
     session_id: str
     user_responses: Dict[str, Any]
+    summary: str = ""
     follow_up_needed: bool = False
     current_question: Optional[str] = None
 
+class TurnReply(BaseModel):
+    """Structured output for a single conversational turn"""
+    status: Literal["NEEDS_FOLLOWUP", "COMPLETE"]
+    reply: str
+
+class ValidationResult(BaseModel):
+    """Structured output for validating a single user response"""
+    valid: bool
+
+@lru_cache(maxsize=1024)
+def _render_user_context(responses_key: Tuple[Tuple[str, Any], ...]) -> str:
+    """Render the user context block; memoized on the sorted responses"""
+    if not responses_key:
+        return ""
+    
+    user_context = "\n".join(f"- {key}: {value}" for key, value in responses_key)
+    return f"User Context:\n{user_context}\n\n"
+
+def _responses_digest(responses: Dict[str, Any]) -> bytes:
+    """Content hash of a set of Step 1 responses, independent of key order"""
+    return hashlib.blake2b(orjson.dumps(responses, option=orjson.OPT_SORT_KEYS), digest_size=16).digest()
+
+# Batch API statuses after which a batch will never produce output
+_BATCH_TERMINAL_STATUSES: Final[frozenset] = frozenset({"completed", "failed", "expired", "cancelled"})
+
+# Metadata tag on batches this app submits, so only those are ever read back
+_BATCH_SOURCE: Final[str] = "pmm-research"
+
+# Validation heuristics applied before falling back to the LLM
+_NAME_PATTERN: Final[re.Pattern] = re.compile(r"^[a-zA-Z0-9 .,&-]+$")
+_MIN_DESCRIPTION_WORDS: Final[int] = 3
+_MAX_DESCRIPTION_CHARS: Final[int] = 2000
+# Placeholder answers that are never a real response to a question
+_TRIVIAL_RESPONSES: Final[frozenset] = frozenset({"ok", "yes", "no", ",", ".", "..."})
+
+def _quick_validate(message: str, question_type: Optional[str]) -> Optional[bool]:
+    """Decide obviously valid or invalid responses; None means ask the LLM"""
+    stripped = message.strip()
+    
+    if len(stripped) < 2 or stripped.lower() in _TRIVIAL_RESPONSES or stripped.isdigit():
+        return False
+    
+    # Short free-text answers (company/product names)
+    if question_type == "text" and _NAME_PATTERN.match(stripped):
+        return True
+    
+    # Descriptions need a few words and must fit the textarea budget
+    if question_type == "textarea":
+        if len(stripped.split()) < _MIN_DESCRIPTION_WORDS or len(stripped) > _MAX_DESCRIPTION_CHARS:
+            return False
+    
+    return None
+
+@lru_cache(maxsize=1)
+def _get_http_client() -> httpx.AsyncClient:
+    """Build the process-wide keep-alive connection pool for OpenAI requests"""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=Config.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=Config.HTTP_MAX_KEEPALIVE_CONNECTIONS
+        )
+    )
+
+@lru_cache(maxsize=1)
+def _get_model() -> RateLimitedChatModel:
+    """Build the process-wide chat model on the shared connection pool and rate limiter"""
+    # All calls go through ainvoke/astream so the AsyncOpenAI client never blocks the event loop
+    chat_model = ChatOpenAI(
+        model=Config.OPENAI_MODEL,
+        api_key=Config.OPENAI_API_KEY,
+        temperature=1.0,  # GPT-5-mini only supports default temperature of 1
+        request_timeout=60,  # 60 second timeout for API requests
+        max_retries=2,  # Retry failed requests up to 2 times
+        http_async_client=_get_http_client()
+    )
+    
+    # Throttle proactively instead of paying 429 retry backoff under load
+    limiter = RateLimiter(
+        requests_per_minute=Config.OPENAI_REQUESTS_PER_MINUTE,
+        tokens_per_minute=Config.OPENAI_TOKENS_PER_MINUTE
+    )
+    return RateLimitedChatModel(chat_model, limiter, Config.OPENAI_MODEL)
+
+@lru_cache(maxsize=1)
+def _get_summary_model() -> ChatOpenAI:
+    """Build the cheap chat model used to summarize older conversation turns"""
+    return ChatOpenAI(
+        model=Config.SUMMARY_MODEL,
+        api_key=Config.OPENAI_API_KEY,
+        request_timeout=60,
+        max_retries=2,
+        http_async_client=_get_http_client()
+    )
+
+@lru_cache(maxsize=1)
+def _get_openai_client() -> AsyncOpenAI:
+    """Build the raw OpenAI client used for Batch API file and batch calls"""
+    return AsyncOpenAI(api_key=Config.OPENAI_API_KEY, http_client=_get_http_client())
+
+async def close_http_client() -> None:
+    """Close the shared OpenAI connection pool, if it was ever opened, and drop every client built on it"""
+    if _get_http_client.cache_info().currsize:
+        await _get_http_client().aclose()
+    # The cached models and raw client hold the pool too; rebuild them all on next use
+    for builder in (_get_http_client, _get_model, _get_summary_model, _get_openai_client):
+        builder.cache_clear()
+
 class PositioningWorkflow:
-    def __init__(self):
-        # Initialize OpenAI model (GPT-5-mini)
-        self.model = ChatOpenAI(
-            model=Config.OPENAI_MODEL,
-            api_key=Config.OPENAI_API_KEY,
-            temperature=1.0,  # GPT-5-mini only supports default temperature of 1
-            request_timeout=60,  # 60 second timeout for API requests
-            max_retries=2  # Retry failed requests up to 2 times
+    def __init__(
+        self,
+        max_messages: int = Config.MAX_SESSION_MESSAGES,
+        max_sessions: int = Config.MAX_CHECKPOINT_SESSIONS,
+        max_history_tokens: int = Config.MAX_HISTORY_TOKENS
+    ):
+        self.max_messages = max_messages
+        self.max_history_tokens = max_history_tokens
+        
+        # Shared OpenAI model (GPT-5-mini), created on first use
+        chat_model = _get_model()
+        
+        # Serve repeated prompts (validation, chat turns) from the prompt cache
+        semantic_index = None
+        if Config.SEMANTIC_CACHE_ENABLED:
+            semantic_index = SemanticIndex(
+                OpenAIEmbeddings(model=Config.EMBEDDING_MODEL, api_key=Config.OPENAI_API_KEY),
+                threshold=Config.SEMANTIC_CACHE_THRESHOLD
+            )
+        self.model = CachedChatModel(
+            chat_model,
+            maxsize=Config.PROMPT_CACHE_SIZE,
+            semantic_index=semantic_index
         )
         
-        # Initialize checkpointer for state persistence
-        self.checkpointer = InMemorySaver()
+        # Plans and research reports (blocking and streamed) skip the non-expiring
+        # prompt cache; finished ones are cached whole, with a TTL, below
+        self.uncached_model = chat_model
+        
+        # Cheap model that folds older turns into the running conversation summary
+        self.summary_model = _get_summary_model()
+        
+        # Classification and reply come back from one structured-output call
+        self.turn_model = self.model.with_structured_output(TurnReply)
+        
+        # Validation returns a parsed boolean instead of free text
+        self.validation_model = self.model.with_structured_output(ValidationResult)
+        
+        # Cap in-flight validation calls so a batch stays under the rate limit
+        self.validation_semaphore = asyncio.Semaphore(Config.MAX_CONCURRENT_VALIDATIONS)
+        
+        # Same for the per-section research calls, shared across all requests
+        self.research_semaphore = asyncio.Semaphore(Config.MAX_CONCURRENT_RESEARCH_CALLS)
+        
+        # Initialize checkpointer for state persistence, bounded so idle sessions
+        # and superseded checkpoints don't accumulate forever
+        self.checkpointer = BoundedInMemorySaver(max_threads=max_sessions)
+        
+        # Finished plans and research reports by Step 1 responses, so repeat inputs
+        # skip prompt rendering and the LLM entirely; failures are never cached
+        self.plan_cache: TTLCache = TTLCache(maxsize=Config.RESULT_CACHE_SIZE, ttl=Config.RESULT_CACHE_TTL_SECONDS)
+        self.research_cache: TTLCache = TTLCache(maxsize=Config.RESULT_CACHE_SIZE, ttl=Config.RESULT_CACHE_TTL_SECONDS)
+        
+        # Per-session run configs, reused across turns (langgraph never mutates them)
+        self.session_configs: LRUCache = LRUCache(maxsize=max_sessions)
         
         # Build the workflow graph
         self.graph = self._build_workflow()
@@ -39,237 +481,116 @@ class PositioningWorkflow:
     def _build_workflow(self) -> StateGraph:
         """Build the LangGraph workflow"""
         
-        def analyze_response(state: WorkflowState) -> Dict[str, Any]:
-            """Analyze user response and determine if follow-up is needed"""
-            if not state.messages:
-                return {"follow_up_needed": False}
-            
-            last_message = state.messages[-1]
-            if isinstance(last_message, HumanMessage):
-                # Use LLM to analyze if response needs clarification
-                analysis_prompt = f"""
-                Analyze this user response for clarity and completeness. 
-                Determine if follow-up questions are needed.
-                
-                Response: {last_message.content}
-                Current Step: {state.current_step}
-                
-                Return 'NEEDS_FOLLOWUP' if the response is unclear, too brief, or needs clarification.
-                Return 'COMPLETE' if the response is clear and sufficient.
-                """
-                
-                analysis_response = self.model.invoke([HumanMessage(content=analysis_prompt)])
-                
-                needs_followup = "NEEDS_FOLLOWUP" in analysis_response.content
-                
-                return {
-                    "follow_up_needed": needs_followup,
-                    "analysis": analysis_response.content
-                }
-            
-            return {"follow_up_needed": False}
-        
-        def generate_followup(state: WorkflowState) -> Dict[str, Any]:
-            """Generate follow-up questions if needed"""
+        async def respond(state: WorkflowState) -> Dict[str, Any]:
+            """Analyze the user response and generate the next reply in a single call"""
             if not state.messages:
-                return {"messages": []}
+                return {"messages": [], "follow_up_needed": False}
             
             last_message = state.messages[-1]
+            if not isinstance(last_message, HumanMessage):
+                return {"follow_up_needed": False}
             
-            followup_prompt = f"""
-            The user provided this response: "{last_message.content}"
+            # Once the history is full (by message count or tokens), fold the oldest turns
+            # into the running summary so that only half the window remains and
+            # summaries run every few turns
+            history = state.messages[:-1]
+            summary = state.summary
+            stale: List[BaseMessage] = []
+            history_tokens = count_tokens("".join(str(message.content) for message in history))
+            if history_tokens > self.max_history_tokens:
+                # A few very long turns: fold all of the earlier history
+                stale = history
+            elif len(state.messages) + 1 > self.max_messages:
+                keep = max(self.max_messages // 2, 2)
+                stale = history[:len(state.messages) + 1 - keep]
+            if stale:
+                summary = await self._summarize(summary, stale)
+                history = history[len(stale):]
             
-            This response needs clarification. Generate 1-2 specific follow-up questions to get clearer, more detailed information.
+            # Static step prompt first, dynamic content after it
+            system_prompt = _TURN_SYSTEM_PROMPTS.get(state.current_step, _DEFAULT_TURN_SYSTEM_PROMPT)
+            user_context = self._get_user_context(state.user_responses)
             
-            Be conversational and helpful. Ask for specific details, examples, or clarification.
-            """
+            # Summary + recent turns keep the prompt size flat however long the session runs
+            prompt_messages: List[BaseMessage] = [SystemMessage(content=system_prompt)]
+            if summary:
+                prompt_messages.append(SystemMessage(content=f"Summary of the earlier conversation:\n{summary}"))
+            prompt_messages.extend(history)
+            prompt_messages.append(HumanMessage(content=f"{user_context}User message: {last_message.content}"))
             
-            followup_response = self.model.invoke([HumanMessage(content=followup_prompt)])
+            turn = await self.turn_model.ainvoke(prompt_messages)
             
             return {
-                "messages": [followup_response],
-                "follow_up_needed": False
+                "messages": [RemoveMessage(id=message.id) for message in stale] + [AIMessage(content=turn.reply)],
+                "summary": summary,
+                "follow_up_needed": turn.status == "NEEDS_FOLLOWUP"
             }
         
-        def generate_response(state: WorkflowState) -> Dict[str, Any]:
-            """Generate appropriate response based on current step and context"""
-            if not state.messages:
-                return {"messages": []}
-            
-            last_message = state.messages[-1]
-            
-            # Create context-aware prompt based on current step
-            context_prompt = self._get_context_prompt(state.current_step, state.user_responses)
-            
-            full_prompt = f"""
-            {context_prompt}
-            
-            User message: {last_message.content}
-            
-            Provide a helpful, conversational response. If this is a response to a specific question, acknowledge it and ask the next question if appropriate.
-            """
-            
-            response = self.model.invoke([HumanMessage(content=full_prompt)])
-            
-            return {"messages": [response]}
-        
-        def should_continue(state: WorkflowState) -> str:
-            """Determine next action based on state"""
-            if state.follow_up_needed:
-                return "followup"
-            else:
-                return "response"
-        
         # Build the graph
         builder = StateGraph(WorkflowState)
         
         # Add nodes
-        builder.add_node("analyze", analyze_response)
-        builder.add_node("followup", generate_followup)
-        builder.add_node("response", generate_response)
+        builder.add_node("respond", respond)
         
         # Add edges
-        builder.add_edge(START, "analyze")
-        builder.add_conditional_edges(
-            "analyze",
-            should_continue,
-            {
-                "followup": "followup",
-                "response": "response"
-            }
-        )
-        builder.add_edge("followup", END)
-        builder.add_edge("response", END)
+        builder.add_edge(START, "respond")
+        builder.add_edge("respond", END)
         
         return builder.compile(checkpointer=self.checkpointer)
     
-    def _get_context_prompt(self, current_step: int, user_responses: Dict[str, Any]) -> str:
-        """Get context-aware prompt based on current step"""
+    async def _summarize(self, summary: str, messages: List[BaseMessage]) -> str:
+        """Fold older conversation turns into the running summary using the cheap model"""
+        transcript = "\n".join(
+            f"{'User' if isinstance(message, HumanMessage) else 'Assistant'}: {message.content}"
+            for message in messages
+        )
         
-        step_contexts = {
-            1: """
-            You are helping with Step 1: Context Gathering & Planning.
-            
-            The user is answering questions about:
-            - Company name
-            - Company description  
-            - Customer description
-            - Positioning experience (first time vs repositioning)
-            - Company scope (whole company vs specific segment)
-            
-            Be conversational and encouraging. Ask follow-up questions if responses are unclear.
-            """,
-            2: """
-            You are helping with Step 2: Customer Understanding & Persona Development.
-            
-            The user has been asked to upload persona documents or indicate they don't have them.
-            If they mention uploading documents, acknowledge it and proceed with automated research.
-            If they say they don't have personas, provide the research todo list and ask if they want automated research.
-            If they want automated research, conduct competitor research to identify ICP, buyers, influencers, and users.
-            
-            Focus on understanding the target customers in detail through:
-            - Document analysis (if uploaded)
-            - Automated competitor research
-            - Customer persona development
-            - ICP identification
-            """,
-            3: """
-            You are helping with Step 3: Stakeholder & Customer Interviews.
-            
-            Focus on gathering insights from stakeholders and customers. Ask about:
-            - Key stakeholders
-            - Interview insights
-            - Customer feedback
-            - Market research
-            """,
-            4: """
-            You are helping with Step 4: Category & Competitive Positioning.
-            
-            Focus on competitive landscape and market positioning. Ask about:
-            - Competitors
-            - Market category
-            - Differentiation
-            - Competitive advantages
-            """,
-            5: """
-            You are helping with Step 5: Feature/Benefit Translation ("Product Legos").
-            
-            Focus on translating features into benefits. Ask about:
-            - Key features
-            - Customer benefits
-            - Value propositions
-            - Product capabilities
-            """,
-            6: """
-            You are helping with Step 6: Positioning Statement Creation.
-            
-            Focus on creating clear positioning statements. Ask about:
-            - Target audience
-            - Market category
-            - Key benefit
-            - Proof points
-            """,
-            7: """
-            You are helping with Step 7: Positioning Workshop Facilitation.
-            
-            Focus on facilitating positioning workshops. Ask about:
-            - Workshop participants
-            - Key insights
-            - Decisions made
-            - Next steps
-            """,
-            8: """
-            You are helping with Step 8: Messaging Framework & Brand Essence.
-            
-            Focus on developing messaging frameworks. Ask about:
-            - Brand essence
-            - Key messages
-            - Tone and voice
-            - Messaging hierarchy
-            """,
-            9: """
-            You are helping with Step 9: Proof Points & Narrative.
-            
-            Focus on developing proof points and narratives. Ask about:
-            - Supporting evidence
-            - Customer stories
-            - Case studies
-            - Success metrics
-            """,
-            10: """
-            You are helping with Step 10: Asset Generation & Application.
-            
-            Focus on creating marketing assets. Ask about:
-            - Asset types needed
-            - Content requirements
-            - Distribution channels
-            - Asset specifications
-            """,
-            11: """
-            You are helping with Step 11: Asset Inventory & Message Testing.
-            
-            Focus on testing and optimizing messages. Ask about:
-            - Testing methods
-            - Performance metrics
-            - Optimization opportunities
-            - Final recommendations
-            """
-        }
+        summary_prompt = f"""
+        Update the running summary of a positioning and messaging conversation with the new turns below.
+        Keep facts the user shared about their company, customers and decisions. Be concise.
         
-        base_context = step_contexts.get(current_step, "You are helping with positioning and messaging.")
+        Current summary:
+        {summary or "(none)"}
         
-        # Add user context if available
-        if user_responses:
-            context_addition = f"\n\nUser Context:\n"
-            for key, value in user_responses.items():
-                context_addition += f"- {key}: {value}\n"
-            base_context += context_addition
+        New turns:
+        {transcript}
+        
+        Updated summary:
+        """
         
-        return base_context
+        try:
+            response = await self.summary_model.ainvoke([HumanMessage(content=summary_prompt)])
+            return response.content
+        except Exception as e:
+            logger.error("Error summarizing conversation: %s", e)
+            # Keep the existing summary; the turns are still dropped from history
+            return summary
+    
+    def _get_session_config(self, session_id: str) -> Dict[str, Any]:
+        """Get the graph run config for a session, creating it on first use"""
+        config = self.session_configs.get(session_id)
+        if config is None:
+            config = {"configurable": {"thread_id": session_id}}
+            self.session_configs[session_id] = config
+        return config
+    
+    def _get_user_context(self, user_responses: Dict[str, Any]) -> str:
+        """Get the dynamic user context block sent alongside the user message"""
+        responses_key = tuple(sorted(user_responses.items()))
+        try:
+            return _render_user_context(responses_key)
+        except TypeError:
+            # Unhashable response values (lists, dicts) can't be memoized
+            return _render_user_context.__wrapped__(responses_key)
     
     async def validate_response(self, message: str, question: str, question_type: str, session_id: str) -> bool:
         """Validate a user response using LangGraph"""
         
+        # Clear-cut inputs are decided without an LLM round trip
+        quick_result = _quick_validate(message, question_type)
+        if quick_result is not None:
+            return quick_result
+        
         validation_prompt = f"""
         You are a validator for user responses in a PMM Assistant conversational interface.
         
@@ -282,133 +603,108 @@ class PositioningWorkflow:
         2. Is it a meaningful, helpful response?
         3. Does it provide useful information?
         
-        IMPORTANT: You must respond with EXACTLY one word:
-        - "VALID" if the response is relevant, meaningful, and helpful
-        - "INVALID" if the response is too generic, unhelpful, or meaningless
+        Set valid to:
+        - true if the response is relevant, meaningful, and helpful
+        - false if the response is too generic, unhelpful, or meaningless
                 
-        Note: Company names, business descriptions, and clear answers are VALID even if brief.
-        
-        Response (VALID or INVALID only):
+        Note: Company names, business descriptions, and clear answers are valid even if brief.
         """
         
         try:
-            response = self.model.invoke([HumanMessage(content=validation_prompt)])
-            
-            # Parse the LLM response more carefully
-            response_text = response.content.strip().upper()
-            print(f"LLM validation response for '{message}': {response_text}")
-            
-            # Check for explicit VALID/INVALID
-            if "VALID" in response_text and "INVALID" not in response_text:
-                return True
-            elif "INVALID" in response_text:
-                return False
-            else:
-                # If LLM didn't follow instructions, default to invalid
-                print(f"LLM returned unclear response: {response_text}. Defaulting to INVALID.")
-                return False
+            result = await self.validation_model.ainvoke([HumanMessage(content=validation_prompt)])
+            logger.debug("LLM validation result for %s question: %s", question_type, result.valid)
+            return result.valid
                 
         except Exception as e:
-            print(f"Validation error: {e}")
+            logger.error("Validation error: %s", e)
             # If there's an error, default to invalid to be safe
             return False
     
-    async def generate_pmm_plan(self, responses: Dict[str, Any], session_id: str) -> str:
-        """Generate a personalized PMM plan based on Step 1 responses"""
-        
-        # Extract key information from responses
-        company_name = responses.get("company_name", "Your company")
-        company_description = responses.get("company_description", "your business")
-        customer_description = responses.get("customer_description", "your customers")
-        positioning_experience = responses.get("positioning_experience", "positioning")
-        company_scope = responses.get("company_scope", "your company")
-        product_name = responses.get("product_name", "")
-        
-        # Build context string
-        context_info = f"""
-        Company Information:
-        - Company Name: {company_name}
-        - Business Description: {company_description}
-        - Customer Description: {customer_description}
-        - Positioning Experience: {positioning_experience}
-        - Company Scope: {company_scope}"""
+    async def validate_responses(self, items: List[Tuple[str, str, str]], session_id: str) -> List[bool]:
+        """Validate several (message, question, question_type) responses concurrently"""
         
-        if product_name:
-            context_info += f"\n        - Product Name: {product_name}"
+        async def validate(message: str, question: str, question_type: str) -> bool:
+            async with self.validation_semaphore:
+                return await self.validate_response(message, question, question_type, session_id)
         
-        plan_prompt = f"""
-        Based on the following information about {company_name}, generate a personalized PMM (Positioning & Messaging) plan that outlines how we'll help them through our 11-step workflow.
-        
-        {context_info}
+        return list(await asyncio.gather(*(validate(*item) for item in items)))
+    
+    def _build_plan_prompt(self, responses: Dict[str, Any]) -> str:
+        """Render the PMM plan prompt from Step 1 responses"""
+        product_name = responses.get("product_name", "")
         
-        Create a brief, personalized plan that mentions all 11 steps of our PMM workflow:
-        1. Context Gathering & Planning
-        2. Customer Understanding & Persona Development
-        3. Stakeholder & Customer Interviews
-        4. Category & Competitive Positioning
-        5. Feature/Benefit Translation ("Product Legos")
-        6. Positioning Statement Creation
-        7. Positioning Workshop Facilitation
-        8. Messaging Framework & Brand Essence
-        9. Proof Points & Narrative
-        10. Asset Generation & Application
-        11. Asset Inventory & Message Testing
+        return _PMM_PROMPT_TEMPLATE.substitute(
+            company_name=responses.get("company_name", "Your company"),
+            company_description=responses.get("company_description", "your business"),
+            customer_description=responses.get("customer_description", "your customers"),
+            positioning_experience=responses.get("positioning_experience", "positioning"),
+            company_scope=responses.get("company_scope", "your company"),
+            product_line=f"\n        - Product Name: {product_name}" if product_name else ""
+        )
+    
+    def _build_fallback_plan(self, responses: Dict[str, Any]) -> str:
+        """Render the canned PMM plan used when the LLM call fails"""
+        product_name = responses.get("product_name", "")
+        company_scope = responses.get("company_scope", "your company")
+        scope_text = f"{product_name} specifically" if product_name else company_scope.lower()
+        
+        return _PMM_FALLBACK_TEMPLATE.substitute(
+            company_name=responses.get("company_name", "Your company"),
+            company_description=responses.get("company_description", "your business"),
+            customer_description=responses.get("customer_description", "your customers"),
+            positioning_experience=responses.get("positioning_experience", "positioning").lower(),
+            scope_text=scope_text
+        )
+    
+    async def generate_pmm_plan(self, responses: Dict[str, Any], session_id: str) -> str:
+        """Generate a personalized PMM plan based on Step 1 responses"""
+        cache_key = _responses_digest(responses)
+        cached = self.plan_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
-        Make it conversational and specific to their business. Explain how each step will help them achieve their positioning and messaging goals.
-        """
+        plan_prompt = self._build_plan_prompt(responses)
         
         try:
-            response = self.model.invoke([HumanMessage(content=plan_prompt)])
+            response = await self.uncached_model.ainvoke([HumanMessage(content=plan_prompt)])
+            self.plan_cache[cache_key] = response.content
             return response.content
         except Exception as e:
-            print(f"Error generating PMM plan: {e}")
-            # Build fallback plan
-            scope_text = f"{company_scope.lower()}"
-            if product_name:
-                scope_text = f"{product_name} specifically"
-            
-            return f"""🎉 **Great! You've completed Step 1: Context Gathering & Planning**
-
-Based on your responses about **{company_name}**, here's how I'll help you through our comprehensive PMM workflow:
-
-**Your Personalized PMM Journey:**
-
-**Step 2: Customer Understanding & Persona Development** - We'll dive deep into understanding your {customer_description} to create detailed customer personas.
-
-**Step 3: Stakeholder & Customer Interviews** - We'll gather insights from key stakeholders and customers to inform your positioning.
-
-**Step 4: Category & Competitive Positioning** - We'll analyze your competitive landscape and define your market category.
-
-**Step 5: Feature/Benefit Translation ("Product Legos")** - We'll translate your {company_description} features into compelling customer benefits.
-
-**Step 6: Positioning Statement Creation** - We'll craft clear, compelling positioning statements for **{company_name}**.
-
-**Step 7: Positioning Workshop Facilitation** - We'll facilitate workshops to refine and validate your positioning.
-
-**Step 8: Messaging Framework & Brand Essence** - We'll develop your core messaging framework and brand essence.
-
-**Step 9: Proof Points & Narrative** - We'll create supporting evidence and compelling narratives.
-
-**Step 10: Asset Generation & Application** - We'll develop marketing assets and content.
-
-**Step 11: Asset Inventory & Message Testing** - We'll test and optimize your messaging for maximum impact.
-
-Since you're doing this {positioning_experience.lower()} for {scope_text}, we'll tailor each step to your specific needs and goals."""
+            logger.error("Error generating PMM plan: %s", e)
+            return self._build_fallback_plan(responses)
+    
+    async def generate_pmm_plan_stream(self, responses: Dict[str, Any], session_id: str) -> AsyncIterator[str]:
+        """Stream a personalized PMM plan token by token as the model generates it"""
+        plan_prompt = self._build_plan_prompt(responses)
+        
+        streamed = False
+        try:
+            async for chunk in self.uncached_model.astream([HumanMessage(content=plan_prompt)]):
+                if chunk.content:
+                    streamed = True
+                    yield chunk.content
+        except Exception as e:
+            logger.error("Error generating PMM plan: %s", e)
+            # A partial plan can't be completed with the fallback, so let the caller
+            # report the failure instead of ending the stream as if it finished
+            if streamed:
+                raise
+            yield self._build_fallback_plan(responses)
 
     async def process_message(self, message: str, session_id: str, current_step: int, previous_responses: Dict[str, Any]) -> str:
         """Process a user message through the workflow"""
         
-        # Create initial state
-        initial_state = WorkflowState(
-            messages=[HumanMessage(content=message)],
-            current_step=current_step,
-            session_id=session_id,
-            user_responses=previous_responses
-        )
+        # Only the fields that change per turn; a full WorkflowState would write every
+        # default (summary="") over the checkpointed values before respond runs
+        turn_input = {
+            "messages": [HumanMessage(content=message)],
+            "current_step": current_step,
+            "session_id": session_id,
+            "user_responses": previous_responses
+        }
         
         # Run the workflow
-        config = {"configurable": {"thread_id": session_id}}
-        result = self.graph.invoke(initial_state, config)
+        result = await self.graph.ainvoke(turn_input, self._get_session_config(session_id))
         
         # Extract the final response
         if result.get("messages"):
@@ -424,56 +720,7 @@ Since you're doing this {positioning_experience.lower()} for {scope_text}, we'll
         # Get user responses from Step 1
         responses = self.get_session_responses(session_id)
         
-        if not responses:
-            return "No user responses found. Please complete Step 1 first."
-        
-        # Extract key information for research
-        company_name = responses.get("company_name", "Unknown Company")
-        company_description = responses.get("company_description", "Unknown business")
-        customer_description = responses.get("customer_description", "Unknown customers")
-        
-        research_prompt = f"""
-        You are a market research analyst conducting automated competitor research. Based on the following company information, research and identify their ICP, buyers, influencers, and users by analyzing competitor websites and market data.
-
-        Company: {company_name}
-        Business: {company_description}
-        Current Customers: {customer_description}
-
-        Conduct comprehensive research and provide detailed insights on:
-
-        1. **Ideal Customer Profile (ICP)**:
-           - Demographics and firmographics
-           - Industry verticals and company sizes
-           - Technology stack and preferences
-           - Pain points and challenges
-
-        2. **Buyer Personas**:
-           - Decision makers vs end users
-           - Roles and responsibilities
-           - Buying journey stages
-           - Decision criteria and influence factors
-
-        3. **Key Influencers**:
-           - Industry thought leaders
-           - Internal champions
-           - Community advocates
-           - Media and analyst relationships
-
-        4. **User Personas**:
-           - End-user characteristics
-           - Usage patterns and behaviors
-           - Feature preferences
-           - Success metrics
-
-        Format your response as a comprehensive research report with clear sections and actionable insights.
-        """
-        
-        try:
-            response = self.model.invoke([HumanMessage(content=research_prompt)])
-            return response.content
-        except Exception as e:
-            logger.error(f"Error conducting competitor research: {str(e)}")
-            return f"Error conducting research: {str(e)}"
+        return await self._run_research(responses)
     
     def get_session_responses(self, session_id: str) -> Dict[str, Any]:
         """Get user responses for a session (placeholder - in production, this would query a database)"""
@@ -485,54 +732,161 @@ Since you're doing this {positioning_experience.lower()} for {scope_text}, we'll
     
     async def conduct_competitor_research_with_responses(self, session_id: str, responses: Dict[str, Any]) -> str:
         """Conduct automated competitor research using provided user responses"""
+        return await self._run_research(responses)
+    
+    def _research_fields(self, responses: Dict[str, Any]) -> Dict[str, str]:
+        """Pick the Step 1 answers the research prompts are built from"""
+        return {
+            "company_name": responses.get("company_name", "Unknown Company"),
+            "company_description": responses.get("company_description", "Unknown business"),
+            "customer_description": responses.get("customer_description", "Unknown customers")
+        }
+    
+    def _build_research_prompt(self, responses: Dict[str, Any]) -> str:
+        """Render the competitor research prompt from Step 1 responses"""
+        return _RESEARCH_PROMPT_TEMPLATE.substitute(self._research_fields(responses))
+    
+    def _build_research_section_prompts(self, responses: Dict[str, Any]) -> List[str]:
+        """Render one focused research prompt per report section"""
+        fields = self._research_fields(responses)
+        return [template.substitute(fields) for template in _RESEARCH_SECTION_TEMPLATES]
+    
+    async def research_section(self, section_prompt: str) -> str:
+        """Research a single report section, waiting for a free research slot"""
+        async with self.research_semaphore:
+            response = await self.uncached_model.ainvoke([HumanMessage(content=section_prompt)])
+        return response.content
+    
+    async def _run_research(self, responses: Dict[str, Any]) -> str:
+        """Research every report section concurrently and join them into one report"""
+        # Trades one long generation for len(_RESEARCH_SECTIONS) shorter parallel calls:
+        # lower latency, but the shared header is sent with every section and each
+        # section counts against the request rate limit. The streaming path keeps
+        # the single combined prompt (one request, tokens as they arrive), so its
+        # report is laid out by the model rather than as these fixed sections.
         
         if not responses:
             return "No user responses found. Please complete Step 1 first."
         
-        # Extract key information for research
-        company_name = responses.get("company_name", "Unknown Company")
-        company_description = responses.get("company_description", "Unknown business")
-        customer_description = responses.get("customer_description", "Unknown customers")
+        cache_key = _responses_digest(responses)
+        cached = self.research_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
-        research_prompt = f"""
-        You are a market research analyst conducting automated competitor research. Based on the following company information, research and identify their ICP, buyers, influencers, and users by analyzing competitor websites and market data.
-
-        Company: {company_name}
-        Business: {company_description}
-        Current Customers: {customer_description}
-
-        Conduct comprehensive research and provide detailed insights on:
-
-        1. **Ideal Customer Profile (ICP)**:
-           - Demographics and firmographics
-           - Industry verticals and company sizes
-           - Technology stack and preferences
-           - Pain points and challenges
-
-        2. **Buyer Personas**:
-           - Decision makers vs end users
-           - Roles and responsibilities
-           - Buying journey stages
-           - Decision criteria and influence factors
-
-        3. **Key Influencers**:
-           - Industry thought leaders
-           - Internal champions
-           - Community advocates
-           - Media and analyst relationships
-
-        4. **User Personas**:
-           - End-user characteristics
-           - Usage patterns and behaviors
-           - Feature preferences
-           - Success metrics
-
-        Format your response as a comprehensive research report with clear sections and actionable insights.
-        """
+        section_prompts = self._build_research_section_prompts(responses)
+        tasks = [asyncio.ensure_future(self.research_section(prompt)) for prompt in section_prompts]
         
         try:
-            response = self.model.invoke([HumanMessage(content=research_prompt)])
-            return response.content
+            sections = await asyncio.gather(*tasks)
+            report = "\n\n".join(sections)
+            self.research_cache[cache_key] = report
+            return report
         except Exception as e:
-            logger.error(f"Error conducting competitor research: {str(e)}")
+            # One failed section sinks the report, so stop paying for the others
+            # and wait for them to release their research slots
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            logger.error("Error conducting competitor research: %s", e)
             return f"Error conducting research: {str(e)}"
+    
+    async def conduct_competitor_research_stream(self, session_id: str, responses: Dict[str, Any]) -> AsyncIterator[str]:
+        """Stream competitor research results token by token as the model generates them"""
+        
+        if not responses:
+            yield "No user responses found. Please complete Step 1 first."
+            return
+        
+        research_prompt = self._build_research_prompt(responses)
+        
+        try:
+            async for chunk in self.uncached_model.astream([HumanMessage(content=research_prompt)]):
+                if chunk.content:
+                    yield chunk.content
+        except Exception as e:
+            logger.error("Error conducting competitor research: %s", e)
+            # Re-raise so the caller can tell a failed stream from a finished one
+            raise
+    
+    async def submit_research_batch(self, sessions: List[Tuple[str, Dict[str, Any]]]) -> Tuple[str, int]:
+        """Submit competitor research for many sessions through the OpenAI Batch API
+
+        Returns the batch id and the number of sessions submitted; sessions without
+        responses are skipped.
+        """
+        
+        # One chat completion request per session; custom_id maps results back
+        lines = [
+            json.dumps({
+                "custom_id": session_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": Config.OPENAI_MODEL,
+                    "messages": [{"role": "user", "content": self._build_research_prompt(responses)}]
+                }
+            })
+            for session_id, responses in sessions
+            if responses
+        ]
+        
+        if not lines:
+            raise ValueError("No sessions with user responses to research")
+        
+        client = _get_openai_client()
+        batch_file = await client.files.create(
+            file=("research_batch.jsonl", "\n".join(lines).encode()),
+            purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+            metadata={"source": _BATCH_SOURCE}
+        )
+        
+        logger.info("Submitted research batch %s for %s sessions", batch.id, len(lines))
+        return batch.id, len(lines)
+    
+    async def get_research_batch(self, batch_id: str) -> Tuple[str, Optional[Dict[str, str]]]:
+        """Get a research batch status and, once completed, the results keyed by session_id"""
+        client = _get_openai_client()
+        batch = await client.batches.retrieve(batch_id)
+        
+        # Never read back batches (or outputs) that this app didn't submit
+        if (batch.metadata or {}).get("source") != _BATCH_SOURCE:
+            raise ValueError(f"Batch {batch_id} is not a research batch")
+        
+        if batch.status != "completed":
+            return batch.status, None
+        
+        # Successful requests land in the output file, failed ones in the error file
+        results: Dict[str, str] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            output = await client.files.content(file_id)
+            for line in output.text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                response = record.get("response") or {}
+                body = response.get("body") or {}
+                choices = body.get("choices") or []
+                if response.get("status_code") == 200 and choices:
+                    results[record["custom_id"]] = choices[0]["message"]["content"]
+                else:
+                    error = record.get("error") or body.get("error")
+                    results[record["custom_id"]] = f"Error conducting research: {error}"
+        
+        return batch.status, results
+    
+    async def wait_for_research_batch(self, batch_id: str, poll_interval: float = 30.0) -> Dict[str, str]:
+        """Poll a research batch until it finishes and return its results"""
+        while True:
+            status, results = await self.get_research_batch(batch_id)
+            if results is not None:
+                return results
+            if status in _BATCH_TERMINAL_STATUSES:
+                raise RuntimeError(f"Research batch {batch_id} ended with status {status}")
+            await asyncio.sleep(poll_interval)
@@ -0,0 +1,134 @@
+from typing import Any, AsyncIterator, List, Optional, Sequence, Tuple
+from langchain_core.messages import AIMessageChunk, BaseMessage, message_chunk_to_message
+from cachetools import LRUCache
+import numpy as np
+import hashlib
+import logging
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+class SemanticIndex:
+    """Bounded nearest-neighbour index of prompt embeddings"""
+
+    def __init__(self, embeddings, threshold: float = 0.95, maxsize: int = 1024):
+        self.embeddings = embeddings
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self._vectors = np.empty((0, 0), dtype=np.float32)
+        self._keys: List[str] = []
+
+    async def embed(self, text: str) -> np.ndarray:
+        """Embed text and normalize it so a dot product is the cosine similarity"""
+        vector = np.asarray(await self.embeddings.aembed_query(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def nearest(self, vector: np.ndarray) -> Optional[str]:
+        """Return the key of the closest stored prompt if it clears the threshold"""
+        if not self._keys:
+            return None
+        scores = self._vectors @ vector
+        best = int(np.argmax(scores))
+        if scores[best] >= self.threshold:
+            return self._keys[best]
+        return None
+
+    def add(self, vector: np.ndarray, key: str) -> None:
+        """Store a prompt embedding, dropping the oldest once the index is full"""
+        if not self._keys:
+            self._vectors = vector[np.newaxis, :]
+        else:
+            self._vectors = np.vstack([self._vectors, vector])[-self.maxsize:]
+        self._keys = (self._keys + [key])[-self.maxsize:]
+
+class CachedChatModel:
+    """Chat model adapter that serves repeated prompts from an exact + semantic cache"""
+
+    def __init__(
+        self,
+        model,
+        maxsize: int = 10_000,
+        semantic_index: Optional[SemanticIndex] = None,
+        namespace: str = "",
+        cache: Optional[LRUCache] = None
+    ):
+        self.model = model
+        self.namespace = namespace
+        self.semantic_index = semantic_index
+        # Exact tier: SHA-256 of the rendered prompt -> completion
+        self._cache = cache if cache is not None else LRUCache(maxsize=maxsize)
+
+    def _prompt_key(self, messages: Sequence[BaseMessage]) -> str:
+        """Hash the rendered messages (and the output namespace) into a cache key"""
+        digest = hashlib.sha256(self.namespace.encode())
+        for message in messages:
+            digest.update(b"\x00" + message.type.encode() + b"\x00" + str(message.content).encode())
+        return digest.hexdigest()
+
+    async def _lookup(self, messages: Sequence[BaseMessage]) -> Tuple[str, Optional[np.ndarray], Any]:
+        """Look the prompt up in both tiers, returning its key, embedding and any cached completion"""
+        key = self._prompt_key(messages)
+
+        cached = self._cache.get(key)
+        if cached is not None or self.semantic_index is None:
+            return key, None, cached
+
+        vector = await self.semantic_index.embed("\n".join(str(m.content) for m in messages))
+        similar_key = self.semantic_index.nearest(vector)
+        cached = self._cache.get(similar_key) if similar_key else None
+        if cached is not None:
+            logger.debug("Semantic prompt cache hit for %s", key)
+        return key, vector, cached
+
+    def _store(self, key: str, vector: Optional[np.ndarray], result: Any) -> None:
+        """Record a fresh completion in both tiers"""
+        self._cache[key] = result
+        if vector is not None:
+            self.semantic_index.add(vector, key)
+
+    async def ainvoke(self, messages: Sequence[BaseMessage], **kwargs) -> Any:
+        """Return a cached completion for the prompt, calling the model on a miss"""
+        key, vector, cached = await self._lookup(messages)
+        if cached is not None:
+            return cached
+
+        result = await self.model.ainvoke(messages, **kwargs)
+        self._store(key, vector, result)
+        return result
+
+    async def astream(self, messages: Sequence[BaseMessage], **kwargs) -> AsyncIterator[Any]:
+        """Stream completion chunks, replaying a cached completion as a single chunk"""
+        key, vector, cached = await self._lookup(messages)
+        if cached is not None:
+            yield AIMessageChunk(content=cached.content)
+            return
+
+        full = None
+        async for chunk in self.model.astream(messages, **kwargs):
+            full = chunk if full is None else full + chunk
+            yield chunk
+
+        # Only complete streams are cached; an interrupted one raises before this point
+        if full is not None:
+            self._store(key, vector, message_chunk_to_message(full))
+
+    def with_structured_output(self, schema, **kwargs) -> "CachedChatModel":
+        """Wrap the structured-output runnable so it shares this cache under its own namespace"""
+        semantic_index = None
+        if self.semantic_index is not None:
+            # Separate index so a near-duplicate never resolves to another output type
+            semantic_index = SemanticIndex(
+                self.semantic_index.embeddings,
+                threshold=self.semantic_index.threshold,
+                maxsize=self.semantic_index.maxsize
+            )
+        return CachedChatModel(
+            self.model.with_structured_output(schema, **kwargs),
+            semantic_index=semantic_index,
+            namespace=f"{self.namespace}:{getattr(schema, '__name__', schema)}",
+            cache=self._cache
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.model, name)
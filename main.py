@@ -1,24 +1,70 @@
-from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi import Depends, FastAPI, Request, HTTPException
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel
-from typing import Dict, List, Optional, Any
+from pydantic import BaseModel, Field
+from typing import TYPE_CHECKING, Annotated, AsyncIterator, Dict, List, Optional, Any, Set
+from contextlib import asynccontextmanager
+from functools import lru_cache
 import uvicorn
 import os
+import asyncio
+import anyio
 from datetime import datetime
-import pandas as pd
+import csv
+import hashlib
 import json
+import orjson
 import logging
+import queue
+import atexit
+from logging.handlers import QueueHandler, QueueListener
 
-from langgraph_workflow import PositioningWorkflow
+from session_store import create_session_store
 from config import Config
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+if TYPE_CHECKING:
+    from langgraph_workflow import PositioningWorkflow
+
+# Configure logging: records are queued and written by a background thread,
+# so a slow or shared stdout never blocks the event loop
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+log_listener = QueueListener(log_queue, logging.StreamHandler(), respect_handler_level=True)
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
+log_listener.start()
+# Flush whatever is still queued when the worker exits
+atexit.register(log_listener.stop)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="PMM Assistant", description="Positioning & Messaging Assistant")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Size the threadpool and warm the tokenizer on startup; release shared clients on shutdown"""
+    # Bounds the threads FastAPI/Starlette use for sync dependencies and file I/O
+    anyio.to_thread.current_default_thread_limiter().total_tokens = Config.THREADPOOL_TOKENS
+    
+    # Load the tokenizer off the event loop so the first LLM call can't stall every
+    # session on its download; if it's slow, counts stay estimated until it lands
+    from token_counter import load_encoder_in_background
+    loader = load_encoder_in_background(Config.OPENAI_MODEL)
+    if loader is not None:
+        await asyncio.to_thread(loader.join, Config.TOKENIZER_WARMUP_TIMEOUT)
+    yield
+    global _workflow
+    await session_store.close()
+    # The workflow, and with it the OpenAI connection pool, only exists once a request needed it
+    if _workflow is not None:
+        from langgraph_workflow import close_http_client
+        await close_http_client()
+        # Its models hold the closed pool, so a restarted app must build a fresh one
+        _workflow = None
+
+app = FastAPI(
+    title="PMM Assistant",
+    description="Positioning & Messaging Assistant",
+    lifespan=lifespan,
+    # orjson serializes the large plan/research/todo strings much faster than stdlib json
+    default_response_class=ORJSONResponse
+)
 
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -26,15 +72,60 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 # Templates
 templates = Jinja2Templates(directory="templates")
 
-# Initialize the LangGraph workflow
-workflow = PositioningWorkflow()
+# LangGraph workflow, built on first use so importing main (and forking workers)
+# doesn't pay for loading LangChain and the OpenAI clients
+_workflow: Optional["PositioningWorkflow"] = None
+
+async def get_workflow() -> "PositioningWorkflow":
+    """Get the shared LangGraph workflow, creating it on first use"""
+    global _workflow
+    if _workflow is None:
+        from langgraph_workflow import PositioningWorkflow
+        _workflow = PositioningWorkflow()
+    return _workflow
 
 # Data models
+# Required string fields must also be non-empty, like the old manual checks
+RequiredStr = Annotated[str, Field(min_length=1)]
+
 class UserResponse(BaseModel):
     step: int
-    question_id: str
-    response: str
-    session_id: str
+    question_id: RequiredStr
+    response: RequiredStr
+    session_id: RequiredStr
+
+class StartWorkflowRequest(BaseModel):
+    session_id: RequiredStr
+
+class ValidateResponseRequest(BaseModel):
+    session_id: RequiredStr
+    message: RequiredStr
+    question: RequiredStr
+    question_type: Optional[str] = None
+
+class ValidationItem(BaseModel):
+    message: RequiredStr
+    question: RequiredStr
+    question_type: Optional[str] = None
+
+class ValidateResponsesRequest(BaseModel):
+    session_id: RequiredStr
+    items: List[ValidationItem] = Field(min_length=1)
+
+class GeneratePlanRequest(BaseModel):
+    session_id: RequiredStr
+    responses: Dict[str, Any] = {}
+
+class ChatRequest(BaseModel):
+    session_id: RequiredStr
+    message: RequiredStr
+
+class PersonaDocumentRequest(BaseModel):
+    session_id: RequiredStr
+    filename: RequiredStr
+
+class ResearchRequest(BaseModel):
+    session_id: RequiredStr
 
 class WorkflowState(BaseModel):
     session_id: str
@@ -43,8 +134,22 @@ class WorkflowState(BaseModel):
     responses: Dict[str, Any]
     is_complete: bool = False
 
-# In-memory storage (in production, use a database)
-workflow_states: Dict[str, WorkflowState] = {}
+# Session storage: Redis when REDIS_URL is set so every worker sees the same
+# sessions, otherwise in process (single worker only)
+session_store = create_session_store(
+    WorkflowState,
+    Config.REDIS_URL,
+    ttl=Config.SESSION_TTL_SECONDS,
+    maxsize=Config.MAX_IN_MEMORY_SESSIONS
+)
+
+async def get_state(session_id: str) -> Optional[WorkflowState]:
+    """Get a workflow session state, or None if the session doesn't exist"""
+    return await session_store.get(session_id)
+
+async def set_state(session_id: str, state: WorkflowState) -> None:
+    """Persist a workflow session state"""
+    await session_store.set(session_id, state)
 
 # Workflow steps definition
 WORKFLOW_STEPS = [
@@ -97,88 +202,117 @@ STEP1_QUESTIONS = [
     }
 ]
 
+# Step 1 lookups, computed once instead of on every submitted response
+STEP1_QUESTION_IDS: frozenset = frozenset(q["id"] for q in STEP1_QUESTIONS)
+STEP1_QUESTION_ORDER: tuple = tuple(q["id"] for q in STEP1_QUESTIONS)
+STEP1_BY_ID: Dict[str, Dict[str, Any]] = {q["id"]: q for q in STEP1_QUESTIONS}
+
+# Step 2 customer research action plan; constant, so clients can cache it by ETag
+_TODO_LIST = """
+## 📋 **Customer Research Action Plan**
+
+To identify your ICP, buyers, influencers, and users, here's what you need to do:
+
+### 1. **Define Your Ideal Customer Profile (ICP)**
+- Identify demographic characteristics (age, location, company size, industry)
+- Determine firmographic details (revenue, employee count, technology stack)
+- Understand psychographic traits (goals, challenges, pain points)
+
+### 2. **Map Your Buyer Personas**
+- Identify decision-makers vs. end-users
+- Understand their roles, responsibilities, and influence levels
+- Map their buying journey and decision criteria
+
+### 3. **Identify Key Influencers**
+- Find industry thought leaders and experts
+- Identify internal champions and advocates
+- Map influencer networks and communities
+
+### 4. **Research User Personas**
+- Understand end-user needs and behaviors
+- Identify usage patterns and preferences
+- Map user journey and touchpoints
+
+### 5. **Conduct Market Research**
+- Analyze competitor customer bases
+- Study industry reports and surveys
+- Gather insights from customer interviews
+
+Would you like me to conduct automated competitor research to help identify your ICP, buyers, influencers, and users?
+        """
+
+_TODO_ETAG = f'"{hashlib.blake2b(_TODO_LIST.encode(), digest_size=8).hexdigest()}"'
+
+@lru_cache(maxsize=1)
+def _render_index() -> str:
+    """Render the main page once; its context is constant"""
+    return templates.get_template("index.html").render(
+        workflow_steps=WORKFLOW_STEPS,
+        current_step=1,
+        step1_questions=STEP1_QUESTIONS
+    )
+
 @app.get("/", response_class=HTMLResponse)
-async def read_root(request: Request):
+async def read_root():
     """Main application page"""
-    return templates.TemplateResponse("index.html", {
-        "request": request,
-        "workflow_steps": WORKFLOW_STEPS,
-        "current_step": 1,
-        "step1_questions": STEP1_QUESTIONS
-    })
+    return HTMLResponse(_render_index())
 
 @app.post("/api/start-workflow")
-async def start_workflow(request: Request):
+async def start_workflow(body: StartWorkflowRequest):
     """Start a new workflow session"""
-    data = await request.json()
-    session_id = data.get("session_id")
-    
-    if not session_id:
-        raise HTTPException(status_code=400, detail="session_id is required")
+    session_id = body.session_id
     
-    workflow_states[session_id] = WorkflowState(
+    await set_state(session_id, WorkflowState(
         session_id=session_id,
         current_step=1,
         completed_steps=[],
         responses={}
-    )
+    ))
     return {"status": "started", "current_step": 1, "session_id": session_id}
 
-@app.get("/api/workflow-state/{session_id}")
+@app.get("/api/workflow-state/{session_id}", response_model=WorkflowState)
 async def get_workflow_state(session_id: str):
     """Get current workflow state"""
-    if session_id not in workflow_states:
+    state = await get_state(session_id)
+    if state is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    state = workflow_states[session_id]
-    return {
-        "current_step": state.current_step,
-        "completed_steps": state.completed_steps,
-        "responses": state.responses,
-        "is_complete": state.is_complete
-    }
+    # Serialized by Pydantic through the response model
+    return state
 
 @app.post("/api/submit-response")
-async def submit_response(request: Request):
+async def submit_response(body: UserResponse):
     """Submit a user response and get next question or move to next step"""
-    data = await request.json()
-    
-    session_id = data.get("session_id")
-    step = data.get("step")
-    question_id = data.get("question_id")
-    response = data.get("response")
-    
-    if not all([session_id, step, question_id, response]):
-        raise HTTPException(status_code=400, detail="Missing required fields")
+    session_id = body.session_id
     
     # If session doesn't exist, recreate it
-    if session_id not in workflow_states:
-        logger.warning(f"Session {session_id} not found, recreating...")
-        workflow_states[session_id] = WorkflowState(
+    state = await get_state(session_id)
+    if state is None:
+        logger.warning("Session %s not found, recreating...", session_id)
+        state = WorkflowState(
             session_id=session_id,
             current_step=1,
             completed_steps=[],
             responses={}
         )
     
-    state = workflow_states[session_id]
-    
     # Store the response
-    state.responses[question_id] = response
+    state.responses[body.question_id] = body.response
     
     # Check if current step is complete
-    if step == 1:
+    if body.step == 1:
         # Check if all Step 1 questions are answered
-        step1_question_ids = [q["id"] for q in STEP1_QUESTIONS]
-        answered_questions = [qid for qid in step1_question_ids if qid in state.responses]
+        answered_questions = STEP1_QUESTION_IDS & state.responses.keys()
         
-        if len(answered_questions) == len(step1_question_ids):
+        if len(answered_questions) == len(STEP1_QUESTION_IDS):
             # Step 1 complete, move to step 2
             state.completed_steps.append(1)
             state.current_step = 2
+            await set_state(session_id, state)
             
-            # Save responses to CSV
-            await save_responses_to_csv(session_id, state.responses)
+            # Save responses to CSV without holding up the response; copy them
+            # so later edits to the session can't change what gets written
+            run_in_background(save_responses_to_csv(session_id, dict(state.responses)))
             
             return {
                 "status": "step_complete",
@@ -187,92 +321,104 @@ async def submit_response(request: Request):
             }
         else:
             # Still more questions in current step
-            remaining_questions = [q for q in STEP1_QUESTIONS if q["id"] not in answered_questions]
+            await set_state(session_id, state)
+            next_question = next(
+                (STEP1_BY_ID[qid] for qid in STEP1_QUESTION_ORDER if qid not in state.responses),
+                None
+            )
             return {
                 "status": "continue_step",
-                "next_question": remaining_questions[0] if remaining_questions else None,
-                "remaining_count": len(remaining_questions)
+                "next_question": next_question,
+                "remaining_count": len(STEP1_QUESTION_IDS) - len(answered_questions)
             }
     
+    await set_state(session_id, state)
     return {"status": "response_saved"}
 
 @app.post("/api/validate-response")
-async def validate_response(request: Request):
+async def validate_response(body: ValidateResponseRequest, workflow=Depends(get_workflow)):
     """Validate user response using LangGraph"""
-    data = await request.json()
-    
-    session_id = data.get("session_id")
-    message = data.get("message")
-    question = data.get("question")
-    question_type = data.get("question_type")
+    # Trivial answers are rejected inside the workflow without an LLM round-trip,
+    # and LLM errors already resolve to invalid there
+    validation_response = await workflow.validate_response(
+        message=body.message,
+        question=body.question,
+        question_type=body.question_type,
+        session_id=body.session_id
+    )
     
-    if not all([session_id, message, question]):
-        raise HTTPException(status_code=400, detail="Missing required fields")
+    return {"is_valid": validation_response}
+
+@app.post("/api/validate-responses")
+async def validate_responses(body: ValidateResponsesRequest, workflow=Depends(get_workflow)):
+    """Validate several user responses in one request"""
+    # Validations run concurrently inside the workflow
+    results = await workflow.validate_responses(
+        [(item.message, item.question, item.question_type) for item in body.items],
+        body.session_id
+    )
     
-    try:
-        # Use LangGraph workflow to validate response
-        validation_response = await workflow.validate_response(
-            message=message,
-            question=question,
-            question_type=question_type,
-            session_id=session_id
-        )
-        
-        return {"is_valid": validation_response}
-    except Exception as e:
-        # Fallback validation
-        is_valid = (
-            len(message.strip()) > 2 and 
-            message.strip().lower() not in ['ok', 'yes', 'no', ',', '.', '...'] and
-            not message.strip().isdigit()
-        )
-        return {"is_valid": is_valid}
+    return {"is_valid": results}
 
 @app.post("/api/generate-plan")
-async def generate_pmm_plan(request: Request):
+async def generate_pmm_plan(body: GeneratePlanRequest, workflow=Depends(get_workflow)):
     """Generate a personalized PMM plan based on Step 1 responses"""
-    data = await request.json()
-    
-    session_id = data.get("session_id")
-    responses = data.get("responses", {})
-    
-    if not session_id:
-        raise HTTPException(status_code=400, detail="session_id is required")
-    
     try:
         # Generate personalized plan using LangGraph workflow
-        plan = await workflow.generate_pmm_plan(responses, session_id)
+        plan = await workflow.generate_pmm_plan(body.responses, body.session_id)
         
         return {"plan": plan}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating plan: {str(e)}")
 
+async def _sse_events(chunks: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    """Frame text chunks as server-sent events, ending with a done or error event"""
+    try:
+        async for chunk in chunks:
+            # JSON-encode each chunk so newlines in the markdown can't break SSE framing
+            yield b"data: " + orjson.dumps({"delta": chunk}) + b"\n\n"
+    except Exception as e:
+        # Headers are already sent, so the failure can only be reported in-stream
+        logger.error("Error streaming response: %s", e)
+        yield b"event: error\ndata: " + orjson.dumps({"detail": str(e)}) + b"\n\n"
+        return
+    yield b"event: done\ndata: {}\n\n"
+
+def _sse_response(chunks: AsyncIterator[str]) -> StreamingResponse:
+    """Stream chunks to the client as they are generated"""
+    return StreamingResponse(
+        _sse_events(chunks),
+        media_type="text/event-stream",
+        # Keep proxies from buffering the stream or caching it
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.post("/api/generate-plan/stream")
+async def generate_pmm_plan_stream(body: GeneratePlanRequest, workflow=Depends(get_workflow)):
+    """Stream a personalized PMM plan as server-sent events"""
+    return _sse_response(workflow.generate_pmm_plan_stream(body.responses, body.session_id))
+
 @app.post("/api/chat")
-async def chat_with_workflow(request: Request):
+async def chat_with_workflow(body: ChatRequest, workflow=Depends(get_workflow)):
     """Chat endpoint for LangGraph workflow"""
-    data = await request.json()
-    session_id = data.get("session_id")
-    message = data.get("message")
-    
-    if not session_id or not message:
-        raise HTTPException(status_code=400, detail="session_id and message are required")
+    session_id = body.session_id
     
     # If session doesn't exist, recreate it
-    if session_id not in workflow_states:
-        logger.warning(f"Session {session_id} not found, recreating...")
-        workflow_states[session_id] = WorkflowState(
+    state = await get_state(session_id)
+    if state is None:
+        logger.warning("Session %s not found, recreating...", session_id)
+        state = WorkflowState(
             session_id=session_id,
             current_step=1,
             completed_steps=[],
             responses={}
         )
-    
-    state = workflow_states[session_id]
+        await set_state(session_id, state)
     
     # Process with LangGraph workflow
     try:
         response = await workflow.process_message(
-            message=message,
+            message=body.message,
             session_id=session_id,
             current_step=state.current_step,
             previous_responses=state.responses
@@ -282,26 +428,43 @@ async def chat_with_workflow(request: Request):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Workflow error: {str(e)}")
 
+def _write_csv(filename: str, rows: List[List[str]]) -> None:
+    """Write CSV rows to a file (blocking, run off the event loop)"""
+    with open(filename, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(["session_id", "question_id", "response", "timestamp"])
+        writer.writerows(rows)
+
 async def save_responses_to_csv(session_id: str, responses: Dict[str, Any]):
     """Save user responses to CSV file"""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"responses_{session_id}_{timestamp}.csv"
     
-    # Create DataFrame
-    df_data = []
-    for question_id, response in responses.items():
-        df_data.append({
-            "session_id": session_id,
-            "question_id": question_id,
-            "response": response,
-            "timestamp": datetime.now().isoformat()
-        })
+    saved_at = datetime.now().isoformat()
+    rows = [
+        [session_id, question_id, response, saved_at]
+        for question_id, response in responses.items()
+    ]
     
-    df = pd.DataFrame(df_data)
-    df.to_csv(filename, index=False)
+    await asyncio.to_thread(_write_csv, filename, rows)
     
     return filename
 
+# Strong references to fire-and-forget tasks so they aren't garbage collected mid-run
+background_tasks: Set[asyncio.Task] = set()
+
+def _on_background_task_done(task: asyncio.Task) -> None:
+    """Forget a finished background task and log its failure, if any"""
+    background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Background task failed: %s", task.exception())
+
+def run_in_background(coro) -> None:
+    """Schedule a coroutine without waiting for it to finish"""
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(_on_background_task_done)
+
 @app.get("/api/workflow-steps")
 async def get_workflow_steps():
     """Get all workflow steps"""
@@ -316,84 +479,40 @@ async def get_step_questions(step_number: int):
         return {"questions": [], "message": f"Step {step_number} questions not yet implemented"}
 
 @app.post("/api/upload-persona-document")
-async def upload_persona_document(request: Request):
+async def upload_persona_document(body: PersonaDocumentRequest):
     """Handle persona document upload for Step 2"""
     try:
-        data = await request.json()
-        session_id = data.get("session_id")
-        filename = data.get("filename")
-        
-        if not session_id or not filename:
-            raise HTTPException(status_code=400, detail="Session ID and filename are required")
-        
         # For now, just acknowledge the upload (in a real app, you'd save the file)
-        logger.info(f"Persona document uploaded for session {session_id}: {filename}")
+        logger.info("Persona document uploaded for session %s: %s", body.session_id, body.filename)
         
-        return {"message": "Document uploaded successfully", "filename": filename}
+        return {"message": "Document uploaded successfully", "filename": body.filename}
         
     except Exception as e:
-        logger.error(f"Error uploading persona document: {str(e)}")
+        logger.error("Error uploading persona document: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/api/get-customer-research-todo")
-async def get_customer_research_todo():
+@app.api_route("/api/get-customer-research-todo", methods=["GET", "POST"])
+async def get_customer_research_todo(request: Request):
     """Generate customer research todo list for Step 2"""
-    try:
-        todo_list = """
-## 📋 **Customer Research Action Plan**
-
-To identify your ICP, buyers, influencers, and users, here's what you need to do:
-
-### 1. **Define Your Ideal Customer Profile (ICP)**
-- Identify demographic characteristics (age, location, company size, industry)
-- Determine firmographic details (revenue, employee count, technology stack)
-- Understand psychographic traits (goals, challenges, pain points)
-
-### 2. **Map Your Buyer Personas**
-- Identify decision-makers vs. end-users
-- Understand their roles, responsibilities, and influence levels
-- Map their buying journey and decision criteria
-
-### 3. **Identify Key Influencers**
-- Find industry thought leaders and experts
-- Identify internal champions and advocates
-- Map influencer networks and communities
-
-### 4. **Research User Personas**
-- Understand end-user needs and behaviors
-- Identify usage patterns and preferences
-- Map user journey and touchpoints
-
-### 5. **Conduct Market Research**
-- Analyze competitor customer bases
-- Study industry reports and surveys
-- Gather insights from customer interviews
-
-Would you like me to conduct automated competitor research to help identify your ICP, buyers, influencers, and users?
-        """
-        
-        return {"todo_list": todo_list}
-        
-    except Exception as e:
-        logger.error(f"Error generating todo list: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    headers = {"Cache-Control": "public, max-age=3600", "ETag": _TODO_ETAG}
+    
+    if_none_match = request.headers.get("if-none-match", "")
+    if _TODO_ETAG in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    
+    return ORJSONResponse({"todo_list": _TODO_LIST}, headers=headers)
 
 @app.post("/api/conduct-competitor-research")
-async def conduct_competitor_research(request: Request):
+async def conduct_competitor_research(body: ResearchRequest, workflow=Depends(get_workflow)):
     """Conduct automated competitor research using GPT-5-nano"""
+    session_id = body.session_id
+    
     try:
-        data = await request.json()
-        session_id = data.get("session_id")
-        
-        if not session_id:
-            raise HTTPException(status_code=400, detail="Session ID is required")
-        
         # Get session state to access user responses
-        if session_id not in workflow_states:
+        state = await get_state(session_id)
+        if state is None:
             raise HTTPException(status_code=404, detail="Session not found")
         
-        state = workflow_states[session_id]
-        
         # Use LangGraph to conduct research with actual user responses
         research_results = await workflow.conduct_competitor_research_with_responses(
             session_id, state.responses
@@ -402,11 +521,26 @@ async def conduct_competitor_research(request: Request):
         return {"research_results": research_results}
         
     except Exception as e:
-        logger.error(f"Error conducting competitor research: {str(e)}")
+        logger.error("Error conducting competitor research: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/conduct-competitor-research/stream")
+async def conduct_competitor_research_stream(body: ResearchRequest, workflow=Depends(get_workflow)):
+    """Stream competitor research results as server-sent events"""
+    state = await get_state(body.session_id)
+    if state is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    
+    return _sse_response(workflow.conduct_competitor_research_stream(body.session_id, state.responses))
+
 if __name__ == "__main__":
     # Validate configuration
     Config.validate()
     
-    uvicorn.run(app, host=Config.HOST, port=Config.PORT)
+    # uvicorn's default "auto" loop/http use uvloop and httptools when installed
+    uvicorn.run(
+        "main:app",
+        host=Config.HOST,
+        port=Config.PORT,
+        workers=Config.WEB_CONCURRENCY
+    )
@@ -0,0 +1,90 @@
+from typing import Any, AsyncIterator, Sequence
+from langchain_core.messages import BaseMessage
+import asyncio
+import logging
+import time
+from token_counter import count_tokens
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+class RateLimiter:
+    """Token-bucket throttle for requests per minute and tokens per minute"""
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._available_requests = float(requests_per_minute)
+        self._available_tokens = float(tokens_per_minute)
+        self._last_refill = time.monotonic()
+        # Held while waiting so callers are served in arrival order
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Top both buckets up in proportion to the time since the last refill"""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._available_requests = min(
+            self.requests_per_minute,
+            self._available_requests + elapsed * self.requests_per_minute / 60
+        )
+        self._available_tokens = min(
+            self.tokens_per_minute,
+            self._available_tokens + elapsed * self.tokens_per_minute / 60
+        )
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until one request and the given number of tokens fit under the limits"""
+        # A single request larger than the whole budget still gets to run once the bucket is full
+        tokens = min(tokens, self.tokens_per_minute)
+
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._available_requests >= 1 and self._available_tokens >= tokens:
+                    self._available_requests -= 1
+                    self._available_tokens -= tokens
+                    return
+
+                wait = max(
+                    (1 - self._available_requests) * 60 / self.requests_per_minute,
+                    (tokens - self._available_tokens) * 60 / self.tokens_per_minute,
+                    0.01
+                )
+                logger.debug("Rate limit reached, waiting %.2fs", wait)
+                await asyncio.sleep(wait)
+
+class RateLimitedChatModel:
+    """Chat model adapter that waits on a RateLimiter before every call"""
+
+    def __init__(self, model, limiter: RateLimiter, model_name: str):
+        self.model = model
+        self.limiter = limiter
+        self.model_name = model_name
+
+    def _estimate_tokens(self, messages: Sequence[BaseMessage]) -> int:
+        """Estimate the prompt size in tokens"""
+        return count_tokens("".join(str(message.content) for message in messages), self.model_name)
+
+    async def ainvoke(self, messages: Sequence[BaseMessage], **kwargs) -> Any:
+        """Invoke the model once the rate limiter admits the request"""
+        await self.limiter.acquire(self._estimate_tokens(messages))
+        return await self.model.ainvoke(messages, **kwargs)
+
+    async def astream(self, messages: Sequence[BaseMessage], **kwargs) -> AsyncIterator[Any]:
+        """Stream from the model once the rate limiter admits the request"""
+        await self.limiter.acquire(self._estimate_tokens(messages))
+        async for chunk in self.model.astream(messages, **kwargs):
+            yield chunk
+
+    def with_structured_output(self, schema, **kwargs) -> "RateLimitedChatModel":
+        """Wrap the structured-output runnable behind the same limiter"""
+        return RateLimitedChatModel(
+            self.model.with_structured_output(schema, **kwargs),
+            self.limiter,
+            self.model_name
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.model, name)
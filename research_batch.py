@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Bulk competitor research through the OpenAI Batch API, for nightly or bulk sweeps
+
+Usage:
+  python research_batch.py submit <session_id> [<session_id> ...]
+  python research_batch.py wait <batch_id>
+"""
+
+import asyncio
+import json
+import sys
+
+from config import Config
+
+async def submit(session_ids):
+    """Queue research for the given sessions and print the batch id"""
+    from main import get_state, session_store
+    from langgraph_workflow import PositioningWorkflow, close_http_client
+
+    try:
+        states = await asyncio.gather(*(get_state(session_id) for session_id in session_ids))
+        sessions = [
+            (session_id, state.responses)
+            for session_id, state in zip(session_ids, states)
+            if state is not None
+        ]
+
+        batch_id, submitted = await PositioningWorkflow().submit_research_batch(sessions)
+        print(f"✅ Submitted batch {batch_id} for {submitted} of {len(session_ids)} sessions")
+    finally:
+        await session_store.close()
+        await close_http_client()
+
+async def wait(batch_id):
+    """Poll a research batch until it finishes and print its results as JSON"""
+    from langgraph_workflow import PositioningWorkflow, close_http_client
+
+    try:
+        results = await PositioningWorkflow().wait_for_research_batch(batch_id)
+        print(json.dumps(results, indent=2))
+    finally:
+        await close_http_client()
+
+def main():
+    """Run the requested batch command"""
+    if len(sys.argv) < 3 or sys.argv[1] not in ("submit", "wait"):
+        print(__doc__.strip())
+        sys.exit(1)
+
+    # Sessions only outlive the web workers (and are visible here) through Redis
+    if sys.argv[1] == "submit" and not Config.REDIS_URL:
+        print("❌ REDIS_URL is required to read sessions outside the web server")
+        sys.exit(1)
+
+    try:
+        if sys.argv[1] == "submit":
+            asyncio.run(submit(sys.argv[2:]))
+        else:
+            asyncio.run(wait(sys.argv[2]))
+    except Exception as e:
+        print(f"❌ Research batch failed: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+from typing import Generic, Optional, Type, TypeVar
+from pydantic import BaseModel
+from cachetools import TTLCache
+import redis.asyncio as redis
+
+StateT = TypeVar("StateT", bound=BaseModel)
+
+class InMemorySessionStore(Generic[StateT]):
+    """Per-process session store, only correct with a single worker"""
+
+    def __init__(self, model: Type[StateT], ttl: int, maxsize: int):
+        self.model = model
+        # Bounded and expiring so idle sessions don't pin memory forever
+        self._states: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, session_id: str) -> Optional[StateT]:
+        """Get a session state, or None if the session doesn't exist"""
+        state = self._states.get(session_id)
+        if state is not None:
+            # Re-set on read so the expiry slides, like GETEX in the Redis store
+            self._states[session_id] = state
+        return state
+
+    async def set(self, session_id: str, state: StateT) -> None:
+        """Create or replace a session state"""
+        self._states[session_id] = state
+
+    async def close(self) -> None:
+        """Nothing to release for the in-process store"""
+
+class RedisSessionStore(Generic[StateT]):
+    """Session store shared by every worker, holding JSON-serialized states in Redis"""
+
+    def __init__(self, model: Type[StateT], url: str, ttl: int, key_prefix: str = "pmm:session:"):
+        self.model = model
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+        self.client = redis.Redis.from_url(url)
+
+    async def get(self, session_id: str) -> Optional[StateT]:
+        """Get a session state, or None if the session doesn't exist"""
+        # Reading a session pushes its expiry back, so only idle sessions expire
+        data = await self.client.getex(self.key_prefix + session_id, ex=self.ttl)
+        if data is None:
+            return None
+        return self.model.model_validate_json(data)
+
+    async def set(self, session_id: str, state: StateT) -> None:
+        """Create or replace a session state"""
+        await self.client.set(self.key_prefix + session_id, state.model_dump_json(), ex=self.ttl)
+
+    async def close(self) -> None:
+        """Close the Redis connection pool"""
+        await self.client.aclose()
+
+def create_session_store(model: Type[StateT], url: Optional[str], ttl: int, maxsize: int):
+    """Use Redis when a URL is configured, otherwise keep sessions in process"""
+    if url:
+        return RedisSessionStore(model, url, ttl)
+    return InMemorySessionStore(model, ttl, maxsize)
@@ -46,14 +46,16 @@ def main():
     
     # Import and run the main application
     try:
-        from main import app
         import uvicorn
         from config import Config
         
+        # Import string so uvicorn can start several worker processes; the default
+        # "auto" loop/http pick uvloop and httptools wherever they are installed
         uvicorn.run(
-            app, 
-            host=Config.HOST, 
+            "main:app",
+            host=Config.HOST,
             port=Config.PORT,
+            workers=Config.WEB_CONCURRENCY,
             log_level="info"
         )
     except KeyboardInterrupt:
@@ -446,12 +446,8 @@ class PMMAssistant {
     
     async showCustomerResearchTodo() {
         try {
-            const response = await fetch('/api/get-customer-research-todo', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                }
-            });
+            // GET so the browser can revalidate the cached list by ETag
+            const response = await fetch('/api/get-customer-research-todo');
             
             const data = await response.json();
             this.addChatMessage('assistant', data.todo_list);
@@ -5,36 +5,29 @@ Test script to verify PMM Assistant setup
 
 import sys
 import os
+from importlib.metadata import PackageNotFoundError, version
+
+# (distribution name, display name) of the packages the app needs installed
+REQUIRED_PACKAGES = [
+    ("fastapi", "FastAPI"),
+    ("langgraph", "LangGraph"),
+    ("langchain-openai", "LangChain OpenAI"),
+    ("httpx", "HTTPX"),
+    ("orjson", "orjson"),
+    ("redis", "Redis"),
+    ("cachetools", "cachetools"),
+    ("tiktoken", "tiktoken"),
+    ("numpy", "NumPy"),
+]
 
 def test_imports():
-    """Test if all required packages can be imported"""
-    try:
-        import fastapi
-        print("✅ FastAPI imported successfully")
-    except ImportError as e:
-        print(f"❌ FastAPI import failed: {e}")
-        return False
-    
-    try:
-        import langgraph
-        print("✅ LangGraph imported successfully")
-    except ImportError as e:
-        print(f"❌ LangGraph import failed: {e}")
-        return False
-    
-    try:
-        import langchain_openai
-        print("✅ LangChain OpenAI imported successfully")
-    except ImportError as e:
-        print(f"❌ LangChain OpenAI import failed: {e}")
-        return False
-    
-    try:
-        import pandas
-        print("✅ Pandas imported successfully")
-    except ImportError as e:
-        print(f"❌ Pandas import failed: {e}")
-        return False
+    """Test if all required packages are installed, without importing them"""
+    for package, name in REQUIRED_PACKAGES:
+        try:
+            print(f"✅ {name} {version(package)} installed")
+        except PackageNotFoundError:
+            print(f"❌ {name} is not installed")
+            return False
     
     return True
 
@@ -57,6 +50,11 @@ def test_config():
 
 def test_workflow():
     """Test LangGraph workflow initialization"""
+    # Building the workflow loads LangChain and sets up OpenAI clients, so it's opt-in
+    if not os.getenv("PMM_DEEP_TESTS"):
+        print("⚠️  Skipping workflow test - set PMM_DEEP_TESTS=1 to run it")
+        return True
+    
     try:
         from langgraph_workflow import PositioningWorkflow
         
@@ -73,6 +71,57 @@ def test_workflow():
         print(f"❌ Workflow test failed: {e}")
         return False
 
+def test_summary_persistence():
+    """Test that the running conversation summary survives later turns"""
+    # Runs the graph with stub models, so no OpenAI calls are made
+    if not os.getenv("PMM_DEEP_TESTS"):
+        print("⚠️  Skipping summary test - set PMM_DEEP_TESTS=1 to run it")
+        return True
+    
+    try:
+        import asyncio
+        from langchain_core.messages import AIMessage
+        from langgraph_workflow import PositioningWorkflow, TurnReply
+        
+        from config import Config
+        if not Config.OPENAI_API_KEY:
+            print("⚠️  Skipping summary test - no API key")
+            return True
+        
+        class StubModel:
+            def __init__(self, reply):
+                self.reply = reply
+                self.calls = 0
+            
+            async def ainvoke(self, messages, **kwargs):
+                self.calls += 1
+                return self.reply(self.calls)
+        
+        # A small window so summaries are written every other turn
+        workflow = PositioningWorkflow(max_messages=4)
+        workflow.turn_model = StubModel(lambda n: TurnReply(status="COMPLETE", reply=f"Reply {n}"))
+        workflow.summary_model = StubModel(lambda n: AIMessage(content=f"Summary {n}"))
+        
+        async def run_turns():
+            summaries = []
+            for turn in range(6):
+                await workflow.process_message(f"Message {turn}", "summary-test", 1, {})
+                state = await workflow.graph.aget_state(workflow._get_session_config("summary-test"))
+                summaries.append(state.values.get("summary", ""))
+            return summaries
+        
+        summaries = asyncio.run(run_turns())
+        first = next((i for i, summary in enumerate(summaries) if summary), None)
+        if first is None or not all(summaries[first:]):
+            print(f"❌ Summary was not kept across turns: {summaries}")
+            return False
+        
+        print("✅ Conversation summary survives later turns")
+        return True
+    except Exception as e:
+        print(f"❌ Summary test failed: {e}")
+        return False
+
 def main():
     """Run all tests"""
     print("🧪 Testing PMM Assistant Setup")
@@ -82,6 +131,7 @@ def main():
         ("Package Imports", test_imports),
         ("Configuration", test_config),
         ("LangGraph Workflow", test_workflow),
+        ("Conversation Summary", test_summary_persistence),
     ]
     
     passed = 0
@@ -0,0 +1,60 @@
+from typing import Any, Dict, Optional
+import logging
+import threading
+import time
+import tiktoken
+from config import Config
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Seconds to wait after a failed load before trying again
+_RETRY_INTERVAL = 60.0
+
+# model name -> loaded encoding; failures are never stored so they get retried
+_encoders: Dict[str, Any] = {}
+_loading: Dict[str, threading.Thread] = {}
+_last_attempt: Dict[str, float] = {}
+_lock = threading.Lock()
+
+def _load_encoder(model_name: str) -> None:
+    """Load the tiktoken encoding for a model (blocking: may download the BPE file)"""
+    try:
+        try:
+            encoder = tiktoken.encoding_for_model(model_name)
+        except KeyError:
+            # Models newer than the installed tiktoken use the latest encoding
+            encoder = tiktoken.get_encoding("o200k_base")
+        _encoders[model_name] = encoder
+    except Exception as e:
+        logger.warning("Could not load tiktoken encoding for %s: %s", model_name, e)
+    finally:
+        with _lock:
+            _loading.pop(model_name, None)
+
+def load_encoder_in_background(model_name: str = Config.OPENAI_MODEL) -> Optional[threading.Thread]:
+    """Start loading an encoding off the event loop, unless it is loaded, loading or failed recently"""
+    with _lock:
+        if model_name in _encoders:
+            return None
+        if model_name in _loading:
+            return _loading[model_name]
+        now = time.monotonic()
+        if now - _last_attempt.get(model_name, float("-inf")) < _RETRY_INTERVAL:
+            return None
+        _last_attempt[model_name] = now
+        # Daemon thread: tiktoken's download has no timeout and must never block shutdown
+        thread = threading.Thread(target=_load_encoder, args=(model_name,), daemon=True)
+        _loading[model_name] = thread
+    thread.start()
+    return thread
+
+def count_tokens(text: str, model_name: str = Config.OPENAI_MODEL) -> int:
+    """Count the tokens in text for the given model"""
+    encoder = _encoders.get(model_name)
+    if encoder is None:
+        # Never load on the caller's thread (the event loop); estimate until it's ready
+        load_encoder_in_background(model_name)
+        # Roughly 4 characters per token
+        return len(text) // 4 + 1
+    return len(encoder.encode(text))